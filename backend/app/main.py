@@ -1,13 +1,86 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import httpx
+import ijson
+from httpx_aiohttp import AiohttpTransport
+from cachetools import TTLCache
 from typing import Optional, List
 import asyncio
-from datetime import datetime, timedelta
-import json
+from contextlib import asynccontextmanager, suppress
+from functools import partial
+from operator import itemgetter
+import math
+import orjson
 import os
+import redis.asyncio as redis
+import time
+import xxhash
 
-app = FastAPI(title="MTG Card Database API", version="0.1.0")
+SCRYFALL_API_BASE = "https://api.scryfall.com"
+SCRYFALL_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0
+)
+# Cards per page in Scryfall search results
+SCRYFALL_PAGE_SIZE = 175
+# Extra result pages fetched at once across all requests; Scryfall rate-limits around 10 req/s
+SCRYFALL_PAGE_CONCURRENCY = 4
+scryfall_page_slots = asyncio.Semaphore(SCRYFALL_PAGE_CONCURRENCY)
+# Set to "aiohttp" to send Scryfall requests through aiohttp under heavy concurrency
+SCRYFALL_TRANSPORT = os.getenv("SCRYFALL_TRANSPORT", "httpx")
+# Optional Redis cache shared by all workers, e.g. redis://localhost:6379
+REDIS_URL = os.getenv("REDIS_URL")
+# Fail fast on a slow or unreachable Redis and fall back to Scryfall
+REDIS_TIMEOUT_S = 0.5
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled Scryfall client (and Redis, if configured) for the app's lifetime"""
+    if SCRYFALL_TRANSPORT not in ("httpx", "aiohttp"):
+        raise ValueError(f"Unknown SCRYFALL_TRANSPORT {SCRYFALL_TRANSPORT!r}; expected 'httpx' or 'aiohttp'")
+    
+    transport = None
+    if SCRYFALL_TRANSPORT == "aiohttp":
+        # Keeps the httpx API (and exceptions) while aiohttp does the I/O
+        transport = AiohttpTransport(limits=SCRYFALL_LIMITS)
+    
+    app.state.http = httpx.AsyncClient(
+        base_url=SCRYFALL_API_BASE,
+        timeout=10.0,
+        limits=SCRYFALL_LIMITS,
+        http2=True,
+        transport=transport
+    )
+    app.state.redis = redis.from_url(
+        REDIS_URL,
+        socket_timeout=REDIS_TIMEOUT_S,
+        socket_connect_timeout=REDIS_TIMEOUT_S
+    ) if REDIS_URL else None
+    cache_sweeper = asyncio.create_task(sweep_expired_cache())
+    yield
+    
+    # Stop background work before closing the clients it uses. Refreshes
+    # await shielded in-flight fetches, so those are cancelled as well.
+    cache_sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await cache_sweeper
+    background_tasks = [*refresh_tasks, *inflight.values()]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    
+    await app.state.http.aclose()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+
+app = FastAPI(
+    title="MTG Card Database API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -23,19 +96,177 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Simple in-memory cache
-cache = {}
-CACHE_DURATION = timedelta(minutes=10)
+# Bounded in-memory cache of (result, fetched_at, etag). Entries are fresh for
+# CACHE_DURATION_S, then served stale while a background refresh runs, and
+# dropped entirely after CACHE_STALE_DURATION_S. fetched_at is a
+# time.monotonic() reading.
+CACHE_DURATION_S = 600.0
+CACHE_STALE_DURATION_S = 3600.0
+CACHE_MAX_ENTRIES = 10000
+cache = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=CACHE_STALE_DURATION_S)
+CACHE_SWEEP_INTERVAL_S = 60.0
 
-def get_cache_key(query: str, page: int, colors: str = "", types: str = "", rarity: str = ""):
-    """Generate cache key from search parameters"""
-    return f"search:{query}:{page}:{colors}:{types}:{rarity}"
+async def sweep_expired_cache():
+    """Periodically drop expired entries; TTLCache only expires them on writes"""
+    while True:
+        await asyncio.sleep(CACHE_SWEEP_INTERVAL_S)
+        cache.expire()
 
-def is_cache_valid(timestamp: datetime) -> bool:
-    """Check if cache entry is still valid"""
-    return datetime.now() - timestamp < CACHE_DURATION
+# (field, default factory) pairs copied from each Scryfall card and card face;
+# missing fields get a fresh container (or None) so cards never share one
+CARD_FIELDS = (
+    ("id", None),
+    ("name", None),
+    ("mana_cost", None),
+    ("type_line", None),
+    ("oracle_text", None),
+    ("power", None),
+    ("toughness", None),
+    ("colors", list),
+    ("rarity", None),
+    ("set_name", None),
+    ("collector_number", None),
+    ("image_uris", dict),
+    ("scryfall_uri", None),
+    ("prices", dict)
+)
+FACE_FIELDS = (
+    ("name", None),
+    ("mana_cost", None),
+    ("type_line", None),
+    ("oracle_text", None),
+    ("power", None),
+    ("toughness", None),
+    ("image_uris", dict)
+)
 
-SCRYFALL_API_BASE = "https://api.scryfall.com"
+# Filter options never change, so serialize them once at import time
+SEARCH_FILTERS_JSON = orjson.dumps({
+    "colors": [
+        {"value": "W", "label": "White", "symbol": "⚪"},
+        {"value": "U", "label": "Blue", "symbol": "🔵"},
+        {"value": "B", "label": "Black", "symbol": "⚫"},
+        {"value": "R", "label": "Red", "symbol": "🔴"},
+        {"value": "G", "label": "Green", "symbol": "🟢"},
+        {"value": "C", "label": "Colorless", "symbol": "◇"}
+    ],
+    "types": [
+        "creature", "instant", "sorcery", "artifact", "enchantment", 
+        "planeswalker", "land", "tribal", "legendary"
+    ],
+    "rarities": [
+        {"value": "common", "label": "Common"},
+        {"value": "uncommon", "label": "Uncommon"}, 
+        {"value": "rare", "label": "Rare"},
+        {"value": "mythic", "label": "Mythic Rare"}
+    ]
+})
+
+def get_empty_search_result(page: int) -> dict:
+    """Result for a search with no query or filters"""
+    return {
+        "data": [],
+        "total_cards": 0,
+        "has_more": False,
+        "page": page,
+        "message": "Please provide a search query or apply filters."
+    }
+
+# The landing page searches with no criteria, so prebuild the first few pages
+EMPTY_SEARCH_JSON = {page: orjson.dumps(get_empty_search_result(page)) for page in range(1, 6)}
+
+def normalize_query(query: str) -> str:
+    """Lowercase a search string and collapse runs of whitespace"""
+    return " ".join(query.lower().split())
+
+def split_filter(values: str) -> List[str]:
+    """Split a comma-separated filter into sorted, de-duplicated lowercase values"""
+    return sorted({value.strip().lower() for value in values.split(",") if value.strip()})
+
+def get_cache_key(query: str, page: int, colors: str = "", types: str = "", rarity: str = "") -> int:
+    """Hash search parameters into a fixed-size cache key"""
+    h = xxhash.xxh3_64(b"search")
+    for part in (query, str(page), colors, types, rarity):
+        h.update(b"\0")
+        h.update(part.encode())
+    return h.intdigest()
+
+def get_printings_cache_key(card_name: str) -> int:
+    """Hash a card name into a fixed-size cache key"""
+    return xxhash.xxh3_64_intdigest(b"printings\0" + card_name.lower().encode())
+
+def is_cache_fresh(fetched_at: float) -> bool:
+    """Check if cache entry is still within CACHE_DURATION_S"""
+    return time.monotonic() - fetched_at < CACHE_DURATION_S
+
+async def fetch_with_shared_cache(cache_key: int, fetch):
+    """Check the Redis cache shared by other workers before calling fetch()"""
+    redis_client = app.state.redis
+    if redis_client is None:
+        return await fetch()
+    
+    # Entries hold (result, etag, fetched_at as wall-clock time); monotonic
+    # readings aren't comparable across workers
+    redis_key = f"mtg:v2:{cache_key}"
+    try:
+        raw = await redis_client.get(redis_key)
+    except redis.RedisError:
+        raw = None
+    if raw is not None:
+        result, etag, fetched_at = orjson.loads(raw)
+        # Keep the original fetch time so the copy isn't treated as fresher than it is
+        age = max(0.0, time.time() - fetched_at)
+        cache[cache_key] = (result, time.monotonic() - age, etag)
+        return result
+    
+    result = await fetch()
+    
+    # Publish what fetch() cached locally so other workers can reuse it
+    entry = cache.get(cache_key)
+    if entry is not None:
+        fetched_at = time.time() - (time.monotonic() - entry[1])
+        try:
+            await redis_client.set(redis_key, orjson.dumps((entry[0], entry[2], fetched_at)), ex=int(CACHE_DURATION_S))
+        except redis.RedisError:
+            pass
+    return result
+
+# Scryfall fetches currently in flight, keyed like the cache
+inflight = {}
+
+async def fetch_once(cache_key: int, fetch):
+    """Run fetch() once per cache key, sharing its result with concurrent callers"""
+    task = inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(fetch_with_shared_cache(cache_key, fetch))
+        inflight[cache_key] = task
+        task.add_done_callback(lambda _: inflight.pop(cache_key, None))
+    
+    # Shield the shared fetch so one cancelled caller doesn't cancel it for the rest
+    return await asyncio.shield(task)
+
+# Background refreshes of stale entries, referenced until they finish
+refresh_tasks = set()
+
+async def refresh_cache_entry(cache_key: int, fetch):
+    """Re-fetch a stale cache entry; on failure the stale copy is kept"""
+    try:
+        await fetch_once(cache_key, fetch)
+    except Exception:
+        pass
+
+def get_cached(cache_key: int, fetch):
+    """Return a cached result, refreshing it in the background once stale"""
+    entry = cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    result, fetched_at, _ = entry
+    if not is_cache_fresh(fetched_at) and cache_key not in inflight:
+        task = asyncio.create_task(refresh_cache_entry(cache_key, fetch))
+        refresh_tasks.add(task)
+        task.add_done_callback(refresh_tasks.discard)
+    return result
 
 @app.get("/")
 def read_root():
@@ -45,6 +276,79 @@ def read_root():
         "version": "0.1.0"
     }
 
+def copy_fields(source: dict, fields) -> dict:
+    """Copy fields from a Scryfall object, building defaults for missing ones"""
+    return {
+        field: source[field] if field in source else (default() if default else None)
+        for field, default in fields
+    }
+
+def project_face(face: dict) -> dict:
+    """Copy the fields the frontend uses from one card face"""
+    return copy_fields(face, FACE_FIELDS)
+
+def project_card(card: dict) -> dict:
+    """Copy the fields the frontend uses from a Scryfall card object"""
+    # Multi-faced cards show their front face; single-faced cards are their own front
+    faces = card.get("card_faces") or ()
+    front_face = faces[0] if faces else card
+    
+    card_info = copy_fields(card, CARD_FIELDS)
+    card_info["mana_cost"] = front_face.get("mana_cost") or card_info["mana_cost"]
+    card_info["type_line"] = front_face.get("type_line") or card_info["type_line"]
+    card_info["oracle_text"] = front_face.get("oracle_text") or card_info["oracle_text"]
+    card_info["power"] = front_face.get("power")
+    card_info["toughness"] = front_face.get("toughness")
+    card_info["image_uris"] = front_face.get("image_uris") or card_info["image_uris"]
+    card_info["has_multiple_faces"] = bool(faces)
+    card_info["card_faces"] = {
+        "front": project_face(faces[0]),
+        "back": project_face(faces[1]) if len(faces) > 1 else None
+    } if faces else None
+    return card_info
+
+async def fetch_search_results(client: httpx.AsyncClient, cache_key: int, params: dict, page: int):
+    """Fetch one page of search results from Scryfall and cache it"""
+    # Revalidate a cached copy with its ETag instead of re-downloading it
+    entry = cache.get(cache_key)
+    headers = {"If-None-Match": entry[2]} if entry and entry[2] else None
+    response = await client.get("/cards/search", params=params, headers=headers)
+    
+    if response.status_code == 304:
+        cache[cache_key] = (entry[0], time.monotonic(), entry[2])
+        return entry[0]
+    
+    if response.status_code == 404:
+        result = {
+            "data": [],
+            "total_cards": 0,
+            "has_more": False,
+            "page": page,
+            "message": "No cards found matching your search."
+        }
+        # Cache empty results too
+        cache[cache_key] = (result, time.monotonic(), response.headers.get("ETag"))
+        return result
+    
+    response.raise_for_status()
+    scryfall_data = orjson.loads(response.content)
+    
+    # Extract relevant card information
+    cards = [project_card(card) for card in scryfall_data.get("data", [])]
+    
+    result = {
+        "data": cards,
+        "total_cards": scryfall_data.get("total_cards", 0),
+        "has_more": scryfall_data.get("has_more", False),
+        "page": page,
+        "next_page": page + 1 if scryfall_data.get("has_more", False) else None
+    }
+    
+    # Cache the result
+    cache[cache_key] = (result, time.monotonic(), response.headers.get("ETag"))
+    
+    return result
+
 @app.get("/search/cards")
 async def search_cards(
     q: Optional[str] = Query(None, description="Search query for card names"),
@@ -57,165 +361,58 @@ async def search_cards(
     
     # Check if we have any search criteria
     if not q and not colors and not types and not rarity:
-        return {
-            "data": [],
-            "total_cards": 0,
-            "has_more": False,
-            "page": page,
-            "message": "Please provide a search query or apply filters."
-        }
+        content = EMPTY_SEARCH_JSON.get(page) or orjson.dumps(get_empty_search_result(page))
+        return Response(content=content, media_type="application/json")
+    
+    # Normalize inputs so equivalent searches share a cache entry
+    query = normalize_query(q or "")
+    color_list = [c.upper() for c in split_filter(colors or "")]
+    type_list = split_filter(types or "")
+    rarity = normalize_query(rarity or "")
+    
+    # Build advanced search query
+    search_parts = []
+    
+    # Add text query if provided
+    if query:
+        search_parts.append(query)
+    
+    # Add color filter
+    if color_list:
+        color_filter = 'c:' + ''.join(color_list)
+        search_parts.append(color_filter)
+    
+    # Add type filter
+    for card_type in type_list:
+        search_parts.append(f"t:{card_type}")
+    
+    # Add rarity filter
+    if rarity:
+        search_parts.append(f"r:{rarity}")
+    
+    # If no search criteria, use a broad search
+    if not search_parts:
+        search_parts.append("*")  # Wildcard search
+    
+    search_query = " ".join(search_parts)
+    
+    params = {
+        "q": search_query,
+        "page": page,
+        "format": "json"
+    }
     
     # Check cache first
-    cache_key = get_cache_key(q or "", page, colors or "", types or "", rarity or "")
-    if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if is_cache_valid(timestamp):
-            return cached_data
-        else:
-            # Remove expired entry
-            del cache[cache_key]
+    cache_key = get_cache_key(query, page, ",".join(color_list), ",".join(type_list), rarity)
+    fetch = partial(fetch_search_results, app.state.http, cache_key, params, page)
+    cached_data = get_cached(cache_key, fetch)
+    if cached_data is not None:
+        return cached_data
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Build advanced search query
-            search_parts = []
-            
-            # Add text query if provided
-            if q and q.strip():
-                search_parts.append(q.strip())
-            
-            # Add color filter
-            if colors:
-                color_list = [c.strip().upper() for c in colors.split(',')]
-                color_filter = 'c:' + ''.join(color_list)
-                search_parts.append(color_filter)
-            
-            # Add type filter
-            if types:
-                type_list = [t.strip().lower() for t in types.split(',')]
-                for card_type in type_list:
-                    search_parts.append(f"t:{card_type}")
-            
-            # Add rarity filter
-            if rarity:
-                search_parts.append(f"r:{rarity.lower()}")
-            
-            # If no search criteria, use a broad search
-            if not search_parts:
-                search_parts.append("*")  # Wildcard search
-            
-            search_query = " ".join(search_parts)
-            
-            params = {
-                "q": search_query,
-                "page": page,
-                "format": "json"
-            }
-            
-            response = await client.get(
-                f"{SCRYFALL_API_BASE}/cards/search",
-                params=params,
-                timeout=10.0
-            )
-            
-            if response.status_code == 404:
-                result = {
-                    "data": [],
-                    "total_cards": 0,
-                    "has_more": False,
-                    "page": page,
-                    "message": "No cards found matching your search."
-                }
-                # Cache empty results too
-                cache[cache_key] = (result, datetime.now())
-                return result
-            
-            response.raise_for_status()
-            scryfall_data = response.json()
-            
-            # Extract relevant card information
-            cards = []
-            for card in scryfall_data.get("data", []):
-                # Handle double-faced cards
-                if card.get("card_faces"):
-                    # Multi-faced card - extract both faces
-                    faces = card.get("card_faces", [])
-                    front_face = faces[0] if faces else {}
-                    back_face = faces[1] if len(faces) > 1 else None
-                    
-                    card_info = {
-                        "id": card.get("id"),
-                        "name": card.get("name"),
-                        "mana_cost": front_face.get("mana_cost") or card.get("mana_cost"),
-                        "type_line": front_face.get("type_line") or card.get("type_line"),
-                        "oracle_text": front_face.get("oracle_text") or card.get("oracle_text"),
-                        "power": front_face.get("power"),
-                        "toughness": front_face.get("toughness"),
-                        "colors": card.get("colors", []),
-                        "rarity": card.get("rarity"),
-                        "set_name": card.get("set_name"),
-                        "collector_number": card.get("collector_number"),
-                        "image_uris": front_face.get("image_uris") or card.get("image_uris", {}),
-                        "scryfall_uri": card.get("scryfall_uri"),
-                        "prices": card.get("prices", {}),
-                        # Double-faced card specific data
-                        "has_multiple_faces": True,
-                        "card_faces": {
-                            "front": {
-                                "name": front_face.get("name"),
-                                "mana_cost": front_face.get("mana_cost"),
-                                "type_line": front_face.get("type_line"),
-                                "oracle_text": front_face.get("oracle_text"),
-                                "power": front_face.get("power"),
-                                "toughness": front_face.get("toughness"),
-                                "image_uris": front_face.get("image_uris", {})
-                            },
-                            "back": {
-                                "name": back_face.get("name") if back_face else None,
-                                "mana_cost": back_face.get("mana_cost") if back_face else None,
-                                "type_line": back_face.get("type_line") if back_face else None,
-                                "oracle_text": back_face.get("oracle_text") if back_face else None,
-                                "power": back_face.get("power") if back_face else None,
-                                "toughness": back_face.get("toughness") if back_face else None,
-                                "image_uris": back_face.get("image_uris", {}) if back_face else {}
-                            } if back_face else None
-                        }
-                    }
-                else:
-                    # Single-faced card
-                    card_info = {
-                        "id": card.get("id"),
-                        "name": card.get("name"),
-                        "mana_cost": card.get("mana_cost"),
-                        "type_line": card.get("type_line"),
-                        "oracle_text": card.get("oracle_text"),
-                        "power": card.get("power"),
-                        "toughness": card.get("toughness"),
-                        "colors": card.get("colors", []),
-                        "rarity": card.get("rarity"),
-                        "set_name": card.get("set_name"),
-                        "collector_number": card.get("collector_number"),
-                        "image_uris": card.get("image_uris", {}),
-                        "scryfall_uri": card.get("scryfall_uri"),
-                        "prices": card.get("prices", {}),
-                        "has_multiple_faces": False,
-                        "card_faces": None
-                    }
-                cards.append(card_info)
-            
-            result = {
-                "data": cards,
-                "total_cards": scryfall_data.get("total_cards", 0),
-                "has_more": scryfall_data.get("has_more", False),
-                "page": page,
-                "next_page": page + 1 if scryfall_data.get("has_more", False) else None
-            }
-            
-            # Cache the result
-            cache[cache_key] = (result, datetime.now())
-            
-            return result
-            
+        # Concurrent misses for the same search share one Scryfall request
+        return await fetch_once(cache_key, fetch)
+        
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Request to Scryfall API timed out")
     except httpx.HTTPStatusError as e:
@@ -226,139 +423,170 @@ async def search_cards(
 @app.get("/search/filters")
 def get_search_filters():
     """Get available filter options"""
-    return {
-        "colors": [
-            {"value": "W", "label": "White", "symbol": "⚪"},
-            {"value": "U", "label": "Blue", "symbol": "🔵"},
-            {"value": "B", "label": "Black", "symbol": "⚫"},
-            {"value": "R", "label": "Red", "symbol": "🔴"},
-            {"value": "G", "label": "Green", "symbol": "🟢"},
-            {"value": "C", "label": "Colorless", "symbol": "◇"}
-        ],
-        "types": [
-            "creature", "instant", "sorcery", "artifact", "enchantment", 
-            "planeswalker", "land", "tribal", "legendary"
-        ],
-        "rarities": [
-            {"value": "common", "label": "Common"},
-            {"value": "uncommon", "label": "Uncommon"}, 
-            {"value": "rare", "label": "Rare"},
-            {"value": "mythic", "label": "Mythic Rare"}
-        ]
-    }
+    return Response(content=SEARCH_FILTERS_JSON, media_type="application/json")
 
 @app.get("/cache/stats")
-def get_cache_stats():
+async def get_cache_stats():
     """Get cache statistics (for debugging)"""
-    valid_entries = 0
-    expired_entries = 0
-    
-    for key, (data, timestamp) in cache.items():
-        if is_cache_valid(timestamp):
-            valid_entries += 1
-        else:
-            expired_entries += 1
+    cache.expire()
+    now = time.monotonic()
+    fresh_entries = sum(1 for _, fetched_at, _ in cache.values() if now - fetched_at < CACHE_DURATION_S)
     
     return {
         "total_entries": len(cache),
-        "valid_entries": valid_entries,
-        "expired_entries": expired_entries,
-        "cache_duration_minutes": CACHE_DURATION.total_seconds() / 60
+        "fresh_entries": fresh_entries,
+        "stale_entries": len(cache) - fresh_entries,
+        "max_entries": cache.maxsize,
+        "cache_duration_minutes": CACHE_DURATION_S / 60,
+        "stale_duration_minutes": CACHE_STALE_DURATION_S / 60
     }
 
 @app.delete("/cache")
-def clear_cache():
+async def clear_cache():
     """Clear all cache entries"""
     cache.clear()
     return {"message": "Cache cleared successfully"}
 
+def project_printing(card: dict) -> dict:
+    """Copy the fields the frontend uses from one printing of a card"""
+    # Handle double-faced cards for printings
+    image_uris = card.get("image_uris", dict)
+    back_image_uris = {}
+    
+    if not image_uris and card.get("card_faces"):
+        # For double-faced cards, get both faces
+        faces = card.get("card_faces", [])
+        front_face = faces[0] if faces else {}
+        back_face = faces[1] if len(faces) > 1 else None
+        
+        image_uris = front_face.get("image_uris", dict)
+        back_image_uris = back_face.get("image_uris", dict) if back_face else {}
+    
+    return {
+        "id": card.get("id"),
+        "name": card.get("name"),
+        "set_name": card.get("set_name"),
+        "set_code": card.get("set"),
+        "collector_number": card.get("collector_number"),
+        "released_at": card.get("released_at") or "",
+        "rarity": card.get("rarity"),
+        "artist": card.get("artist"),
+        "flavor_text": card.get("flavor_text"),
+        "image_uris": image_uris,
+        "back_image_uris": back_image_uris if back_image_uris else None,
+        "prices": card.get("prices", dict),
+        "scryfall_uri": card.get("scryfall_uri")
+    }
+
+class AsyncByteReader:
+    """Async file-like adapter so ijson can read an httpx byte stream"""
+    def __init__(self, chunks):
+        self.chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk for it
+        if size == 0:
+            return b""
+        # An empty read means EOF to ijson, so skip empty chunks
+        async for chunk in self.chunks:
+            if chunk:
+                return chunk
+        return b""
+
+async def stream_printings_page(client: httpx.AsyncClient, params: dict, page: int) -> List[dict]:
+    """Project one page of printings while it downloads, without decoding the whole page"""
+    async with scryfall_page_slots, client.stream(
+        "GET",
+        "/cards/search",
+        params={**params, "page": page},
+        timeout=15.0
+    ) as response:
+        if response.is_error:
+            # Read the body so the error handler can include it
+            await response.aread()
+        response.raise_for_status()
+        
+        cards = ijson.items_async(AsyncByteReader(response.aiter_bytes()), "data.item", use_float=True)
+        return [project_printing(card) async for card in cards]
+
+async def fetch_card_printings(client: httpx.AsyncClient, cache_key: int, params: dict, card_name: str):
+    """Fetch every printing of a card from Scryfall and cache it"""
+    # Revalidate a cached copy with its ETag instead of re-downloading it
+    entry = cache.get(cache_key)
+    headers = {"If-None-Match": entry[2]} if entry and entry[2] else None
+    response = await client.get(
+        "/cards/search",
+        params=params,
+        headers=headers,
+        timeout=15.0
+    )
+    
+    if response.status_code == 304:
+        cache[cache_key] = (entry[0], time.monotonic(), entry[2])
+        return entry[0]
+    
+    if response.status_code == 404:
+        result = {
+            "data": [],
+            "total_printings": 0,
+            "message": "No printings found for this card."
+        }
+        cache[cache_key] = (result, time.monotonic(), response.headers.get("ETag"))
+        return result
+    
+    response.raise_for_status()
+    scryfall_data = orjson.loads(response.content)
+    
+    # Extract printing information
+    printings = [project_printing(card) for card in scryfall_data.get("data", [])]
+    
+    # Popular cards span several pages; stream the rest in concurrently
+    if scryfall_data.get("has_more"):
+        total_pages = math.ceil(scryfall_data.get("total_cards", 0) / SCRYFALL_PAGE_SIZE)
+        pages = await asyncio.gather(*(
+            stream_printings_page(client, params, page)
+            for page in range(2, total_pages + 1)
+        ))
+        for page_printings in pages:
+            printings.extend(page_printings)
+    
+    
+    # Sort by release date (newest first)
+    printings.sort(key=itemgetter("released_at"), reverse=True)
+    
+    result = {
+        "data": printings,
+        "total_printings": len(printings),
+        "card_name": card_name
+    }
+    
+    # Cache the result
+    cache[cache_key] = (result, time.monotonic(), response.headers.get("ETag"))
+    
+    return result
+
 @app.get("/cards/{card_name}/printings")
 async def get_card_printings(card_name: str):
     """Get all printings/artworks of a specific card"""
-    cache_key = f"printings:{card_name.lower()}"
+    cache_key = get_printings_cache_key(card_name)
+    
+    # Search for exact card name to get all printings
+    params = {
+        "q": f'!"{card_name}"',
+        "format": "json",
+        "unique": "prints"
+    }
     
     # Check cache first
-    if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if is_cache_valid(timestamp):
-            return cached_data
-        else:
-            del cache[cache_key]
+    fetch = partial(fetch_card_printings, app.state.http, cache_key, params, card_name)
+    cached_data = get_cached(cache_key, fetch)
+    if cached_data is not None:
+        return cached_data
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Search for exact card name to get all printings
-            params = {
-                "q": f'!"{card_name}"',
-                "format": "json",
-                "unique": "prints"
-            }
-            
-            response = await client.get(
-                f"{SCRYFALL_API_BASE}/cards/search",
-                params=params,
-                timeout=15.0
-            )
-            
-            if response.status_code == 404:
-                result = {
-                    "data": [],
-                    "total_printings": 0,
-                    "message": "No printings found for this card."
-                }
-                cache[cache_key] = (result, datetime.now())
-                return result
-            
-            response.raise_for_status()
-            scryfall_data = response.json()
-            
-            # Extract printing information
-            printings = []
-            for card in scryfall_data.get("data", []):
-                # Handle double-faced cards for printings
-                image_uris = card.get("image_uris", {})
-                back_image_uris = {}
-                
-                if not image_uris and card.get("card_faces"):
-                    # For double-faced cards, get both faces
-                    faces = card.get("card_faces", [])
-                    front_face = faces[0] if faces else {}
-                    back_face = faces[1] if len(faces) > 1 else None
-                    
-                    image_uris = front_face.get("image_uris", {})
-                    back_image_uris = back_face.get("image_uris", {}) if back_face else {}
-                
-                printing_info = {
-                    "id": card.get("id"),
-                    "name": card.get("name"),
-                    "set_name": card.get("set_name"),
-                    "set_code": card.get("set"),
-                    "collector_number": card.get("collector_number"),
-                    "released_at": card.get("released_at"),
-                    "rarity": card.get("rarity"),
-                    "artist": card.get("artist"),
-                    "flavor_text": card.get("flavor_text"),
-                    "image_uris": image_uris,
-                    "back_image_uris": back_image_uris if back_image_uris else None,
-                    "prices": card.get("prices", {}),
-                    "scryfall_uri": card.get("scryfall_uri")
-                }
-                printings.append(printing_info)
-            
-            # Sort by release date (newest first)
-            printings.sort(key=lambda x: x.get("released_at", ""), reverse=True)
-            
-            result = {
-                "data": printings,
-                "total_printings": len(printings),
-                "card_name": card_name
-            }
-            
-            # Cache the result
-            cache[cache_key] = (result, datetime.now())
-            
-            return result
-            
+        # Concurrent misses for the same card share one Scryfall request
+        return await fetch_once(cache_key, fetch)
+        
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Request to Scryfall API timed out")
     except httpx.HTTPStatusError as e: